@@ -91,8 +91,9 @@ class ContinuedFraction(Fraction):
     __slots__ = ['_elements',]
 
     # Declare all instances to have an ``_elements`` attribute, which must be
-    # a ``tuple`` of ``int``s.
-    _elements: tuple[int]
+    # a ``tuple`` of ``int``s, or ``None`` if the elements have not yet been
+    # computed - see ``_from_reduced``.
+    _elements: tuple[int] | None
 
     def __new__(cls, *args: Any, **kwargs: Any) -> ContinuedFraction:
         """Creates, initialises and returns instances of this class.
@@ -167,6 +168,47 @@ class ContinuedFraction(Fraction):
 
         return self
 
+    @classmethod
+    def _from_reduced(cls, numerator: int, denominator: int, /) -> ContinuedFraction:
+        """Private constructor for a :py:class:`ContinuedFraction` instance from a reduced pair of integers, which defers computing the elements.
+
+        Unlike :py:meth:`~continuedfractions.continuedfraction.ContinuedFraction.__new__`
+        the elements are not computed on construction, but lazily, on first
+        access, by the
+        :py:attr:`~continuedfractions.continuedfraction.ContinuedFraction.elements`
+        property.
+        This is for internal callers which generate many instances whose
+        elements may never be used, such as
+        :py:func:`~continuedfractions.sequences.farey_sequence_generator`.
+        As it is only called internally there is no input validation.
+
+        Parameters
+        ----------
+        numerator : int
+            The numerator, which must be coprime to the denominator.
+
+        denominator : int
+            The (positive) denominator.
+
+        Returns
+        -------
+        ContinuedFraction
+            A :py:class:`ContinuedFraction` instance whose elements have not
+            yet been computed.
+
+        Examples
+        --------
+        >>> cf = ContinuedFraction._from_reduced(649, 200)
+        >>> cf
+        ContinuedFraction(649, 200)
+        >>> cf.elements
+        (3, 4, 12, 4)
+        """
+        self = super().__new__(cls, numerator, denominator)
+        self._elements = None
+
+        return self
+
     @classmethod
     def from_elements(cls, *elements: int) -> ContinuedFraction:
         """Returns a :py:class:`ContinuedFraction` instance from a sequence of (integer) elements of a (finite) simple continued fraction.
@@ -320,7 +362,7 @@ class ContinuedFraction(Fraction):
                 "positive integers."
             )
 
-        elements = self._elements + new_elements
+        elements = self.elements + new_elements
 
         # A step to ensure uniqueness of the simple form of the continued
         # fraction - if the last of the new elements is ``1`` it can be
@@ -408,13 +450,13 @@ class ContinuedFraction(Fraction):
         order = self.order
         truncation_length = len(tail_elements)
 
-        if not tail_elements or truncation_length > order or self._elements[order + 1 - truncation_length:] != tail_elements:
+        if not tail_elements or truncation_length > order or self.elements[order + 1 - truncation_length:] != tail_elements:
             raise ValueError(
                 "The elements/coefficients to be truncated from the tail must "
                 "form a valid segment of the existing tail."
             )
 
-        elements = self._elements[:order + 1 - truncation_length]
+        elements = self.elements[:order + 1 - truncation_length]
 
         # A step to ensure uniqueness of the simple form of the continued
         # fraction - if the last element is ``1`` it can be "removed" by
@@ -443,7 +485,7 @@ class ContinuedFraction(Fraction):
             The boolean result of the equality check.
         """
         if isinstance(other, self.__class__):
-            return self._elements == other._elements
+            return self.elements == other.elements
 
         return super().__eq__(other)
 
@@ -461,7 +503,7 @@ class ContinuedFraction(Fraction):
             :py:class:`~continuedfractions.continuedfraction.ContinuedFraction`
             instance.
         """
-        return hash(self._elements)
+        return hash(self.elements)
 
     def __add__(self, other, /):
         return self.__class__(super().__add__(other))
@@ -538,7 +580,7 @@ class ContinuedFraction(Fraction):
         continued fraction :math:`[a_0; a_1,\\ldots, a_{n - 1} + 1]`.
         """
         cls_ = self.__class__
-        elms = self._elements
+        elms = self.elements
 
         if len(elms) == 1:
             # Case (1) of the algorithm
@@ -553,7 +595,13 @@ class ContinuedFraction(Fraction):
             # Case (4) of the algorithm
             neg_elms = (-(elms[0] + 1), 1, elms[1] - 1, *elms[2:])
 
-        neg_self = cls_.__new__(cls_, *convergent(len(neg_elms) - 1, *neg_elms).as_integer_ratio())
+        # The negated value is just the sign-flipped (coprime) integer pair,
+        # so construct it directly via the ``fractions.Fraction`` superclass
+        # constructor - this avoids recomputing the value from the negated
+        # elements and also running the division algorithm in
+        # ``lib.continued_fraction_rational``, as the negated elements are
+        # already known.
+        neg_self = super().__new__(cls_, -self._numerator, self._denominator)
         neg_self._elements = neg_elms
 
         return neg_self
@@ -629,7 +677,14 @@ class ContinuedFraction(Fraction):
         >>> cf.elements
         (0, 8, 9, 1, 21, 1, 1, 5)
         """
-        return self._elements
+        # The elements of instances created by ``_from_reduced`` are only
+        # computed on first access, and then assigned back to the instance
+        elements = self._elements
+
+        if elements is None:
+            self._elements = elements = tuple(continued_fraction_rational(self))
+
+        return elements
 
     @property
     def order(self) -> int:
@@ -645,7 +700,7 @@ class ContinuedFraction(Fraction):
         >>> cf.order
         7
         """
-        return len(self._elements[1:])
+        return len(self.elements[1:])
 
     @property
     def khinchin_mean(self) -> Decimal | None:
@@ -748,7 +803,7 @@ class ContinuedFraction(Fraction):
         >>> cf.convergent(7)
         ContinuedFraction(2469, 20000)
         """
-        return self.__class__(convergent(k, *self._elements))
+        return self.__class__(convergent(k, *self.elements))
 
     @property
     def convergents(self) -> Generator[tuple[int, ContinuedFraction], None, None]:
@@ -774,7 +829,7 @@ class ContinuedFraction(Fraction):
         >>> tuple(cf.convergents)
         ((0, ContinuedFraction(3, 1)), (1, ContinuedFraction(13, 4)), (2, ContinuedFraction(159, 49)), (3, ContinuedFraction(649, 200)))
         """
-        yield from enumerate(map(self.__class__, convergents(*self._elements)))
+        yield from enumerate(map(self.__class__, convergents(*self.elements)))
 
     @property
     def even_convergents(self) -> Generator[tuple[int, ContinuedFraction], None, None]:
@@ -952,7 +1007,7 @@ class ContinuedFraction(Fraction):
         >>> cf.remainder(7)
         ContinuedFraction(5, 1)
         """
-        return self.__class__(remainder(k, *self._elements))
+        return self.__class__(remainder(k, *self.elements))
 
     @property
     def remainders(self) -> Generator[tuple[int, ContinuedFraction], None, None]:
@@ -985,7 +1040,7 @@ class ContinuedFraction(Fraction):
         """
         yield from zip(
             reversed(range(self.order + 1)),
-            map(self.__class__, remainders(*self._elements))
+            map(self.__class__, remainders(*self.elements))
         )
 
     @functools.cache
@@ -207,10 +207,8 @@ def continued_fraction_real(x: int | float | str | Decimal, /) -> Generator[int,
     """
     if isinstance(x, int):
         yield x
-    elif isinstance(x, str) and '/' in x:
+    elif isinstance(x, float) or (isinstance(x, str) and '/' in x):
         yield from continued_fraction_rational(Fraction(x))
-    elif isinstance(x, float):
-        yield from continued_fraction_rational(Fraction(*Decimal.from_float(x).as_integer_ratio()))
     else:
         yield from continued_fraction_rational(Fraction(*(Decimal(x).as_integer_ratio())))
 
@@ -439,6 +437,36 @@ def fraction_from_elements(*elements: int) -> Fraction:
     if any(not isinstance(elem, int) for elem in elements):
         raise ValueError("Continued fraction elements must be integers")
 
+    # The elements are validated before the cache lookup so that invalid
+    # (non-integer) elements never enter the cache
+    return _fraction_from_elements(elements)
+
+
+@functools.lru_cache(maxsize=4096)
+def _fraction_from_elements(elements: tuple[int], /) -> Fraction:
+    """Private, memoized core of :py:func:`~continuedfractions.lib.fraction_from_elements`.
+
+    Takes the elements as a single tuple, which is the cache key, and assumes
+    they have already been checked to be integers. The cache is bounded, as
+    the elements can be arbitrary user input.
+
+    Parameters
+    ----------
+    elements : `tuple`
+        A tuple of integer elements of a simple continued fraction.
+
+    Returns
+    -------
+    fractions.Fraction
+        A rational number constructed from the elements.
+
+    Examples
+    --------
+    >>> _fraction_from_elements((3, 4, 12, 4))
+    Fraction(649, 200)
+    >>> _fraction_from_elements((3, 4, 12, 4)) is _fraction_from_elements((3, 4, 12, 4))
+    True
+    """
     return convergent(len(elements) - 1, *elements)
 
 
@@ -19,7 +19,7 @@ import functools
 import math
 import sys
 
-from itertools import chain, product, starmap
+from itertools import compress, product
 from pathlib import Path
 from typing import Generator, Literal, TypeAlias
 
@@ -35,6 +35,56 @@ KSRMNode: TypeAlias = tuple[int, int]   #: Custom type for nodes of the KSRM cop
 KSRMBranch: NamedCallableProxy          #: Custom type for generating branches of the KSRM coprime pairs tree
 
 
+@functools.cache
+def _prime_factors(n: int, /) -> tuple[int]:
+    """Returns the (ascending) sequence of distinct prime factors of a given positive integer :math:`n`.
+
+    A private, cached function which uses trial division. As it is only
+    called internally there is no input validation. The caching means that
+    calls to :py:func:`~continuedfractions.sequences.coprime_integers` for the
+    same :math:`n`, but with different ``start`` and ``stop`` values, factorise
+    :math:`n` only once.
+
+    Parameters
+    ----------
+    n : int
+        The positive integer whose distinct prime factors are sought.
+
+    Returns
+    -------
+    tuple
+        The distinct prime factors of :math:`n`, in ascending order. For
+        :math:`n = 1` this is the empty tuple.
+
+    Examples
+    --------
+    >>> _prime_factors(1)
+    ()
+    >>> _prime_factors(2)
+    (2,)
+    >>> _prime_factors(12)
+    (2, 3)
+    >>> _prime_factors(1001)
+    (7, 11, 13)
+    >>> _prime_factors(10 ** 7)
+    (2, 5)
+    """
+    factors = []
+    p = 2
+
+    while p * p <= n:
+        if n % p == 0:
+            factors.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1 if p == 2 else 2
+
+    if n > 1:
+        factors.append(n)
+
+    return tuple(factors)
+
+
 def coprime_integers_generator(n: int, /, *, start: int = 1, stop: int = None) -> Generator[int, None, None]:
     """Generates a sequence of (positive) integers :math:`1 \\leq m < n` coprime to a given positive integer :math:`n`.
 
@@ -52,6 +102,13 @@ def coprime_integers_generator(n: int, /, *, start: int = 1, stop: int = None) -
     initialised to :math:`n`; if :math:`n > 1` and ``stop`` is given then it
     must be an integer in the range :math:`\\text{start} + 1..n`.
 
+    The coprime integers are found by sieving: all multiples of the distinct
+    prime factors of :math:`n` are struck out of the range, and the integers
+    which remain are exactly those coprime to :math:`n`. The range is sieved
+    lazily, in fixed-size chunks walking down from ``stop``, and if factorising
+    :math:`n` would cost more than the range is long, integers in the range
+    are instead tested directly using :py:func:`math.gcd`.
+
     Parameters
     ----------
     n : int
@@ -156,26 +213,40 @@ def coprime_integers_generator(n: int, /, *, start: int = 1, stop: int = None) -
     if n in (1, 2):
         yield 1
     else:
-        chunklen = 1000
         stop = stop or n
-        q, r = divmod((stop - start + 1), chunklen)
 
-        if q == 0:
+        # If trial division of ``n`` (about sqrt(n) steps) would cost more
+        # than testing each integer in the window directly, use ``math.gcd``.
+        if math.isqrt(n) > stop - start + 1:
             yield from filter(
                 lambda m: math.gcd(m, n) == 1,
                 range(stop, start - 1, -1)
             )
-        else:
-            _start = ((chunklen) * q) + (1 if r > 0 else 0)
-            
-            while _start >= start:
-                yield from filter(
-                    lambda m: math.gcd(m, n) == 1,
-                    range(stop, _start - 1, -1)
-                )
-                stop = _start - 1
-                q -= 1
-                _start = ((chunklen) * q) + 1
+            return
+
+        prime_factors = _prime_factors(n)
+        chunklen = 1 << 16
+        hi = stop
+
+        while hi >= start:
+            lo = max(start, hi - chunklen + 1)
+
+            # A sieve of the integers ``hi..lo``, in descending order, in
+            # which all multiples of the distinct prime factors of ``n`` are
+            # struck out - what remains are exactly the integers in this chunk
+            # which are coprime to ``n``. The largest multiple of ``p`` not
+            # exceeding ``hi`` is at index ``hi % p``.
+            sieve = bytearray([1]) * (hi - lo + 1)
+
+            for p in prime_factors:
+                sieve[hi % p::p] = bytes(len(range(hi % p, hi - lo + 1, p)))
+
+            # Filter the (descending) chunk against the sieve in one pass with
+            # ``itertools.compress``, which avoids a Python-level test per
+            # integer.
+            yield from compress(range(hi, lo - 1, -1), sieve)
+
+            hi = lo - 1
 
 
 @functools.cache
@@ -416,32 +487,36 @@ class KSRMTree:
     def _backtrack(
         self,
         n: int,
-        visited: list[tuple[KSRMNode, KSRMBranch]],     # noqa: F821
+        visited_nodes: list[KSRMNode],
+        visited_branch_ids: list[int | None],
         /,
         *,
         node_bound: int = None
-    ) -> tuple[KSRMNode, KSRMBranch, int, KSRMBranch]:  # noqa: F821
+    ) -> tuple[KSRMNode, int | None, int, int | None]:
         """Backtracks on the KSRM coprime pairs trees from a failed node to the nearest previously visited node that satisfies the node bound.
 
         A private function that backtracks on the KSRM coprime pairs trees: the
         procedure is that, given a (positive) integer :math:`n > 2`, for which
-        coprime pairs are being sought, and a sequence (list) of pairs of
-        visited nodes and their associated generating branches in the KSRM
-        tree, and assuming that the last element of the visited sequence
-        contains the node that "failed", the function identifies the nearest
-        previously visited node whose first component satisifes the test
-        :math:`< n` **and** and whose associated generating branch is not equal
-        to the third branch given by :math:`(x, y) \\longmapsto (x + 2y, y)`.
+        coprime pairs are being sought, and two parallel sequences (lists) of
+        visited nodes and the IDs of their associated generating branches in
+        the KSRM tree, and assuming that the last elements of the visited
+        sequences relate to the node that "failed", the function identifies
+        the nearest previously visited node whose first component satisifes the
+        test :math:`< n` **and** and whose associated generating branch is not
+        equal to the third branch given by :math:`(x, y) \\longmapsto (x + 2y, y)`.
+
+        The branch IDs are the (integer) indices ``0``, ``1``, ``2`` of the
+        branches in :py:attr:`~continuedfractions.sequences.KSRMTree.branches`,
+        with ``None`` for a root node, which has no generating branch.
 
         .. note::
 
            The function assumes that the last node in the incoming sequence
-           of visited nodes and generating branch pairs represents a "failed"
-           node, i.e. whose first component failed the test :math:`\\leq n`
-           during the search. No attempt is made to validate or verify the
-           failed node, and the only purpose of the function is to backtrack
-           to the nearest previously visited node which meets the requirements
-           listed above.
+           of visited nodes represents a "failed" node, i.e. whose first
+           component failed the test :math:`\\leq n` during the search. No
+           attempt is made to validate or verify the failed node, and the only
+           purpose of the function is to backtrack to the nearest previously
+           visited node which meets the requirements listed above.
 
         .. note::
 
@@ -457,9 +532,12 @@ class KSRMTree:
             The (positive) integer :math:`> 2` which is passed by the root
             search method or the general tree search method.
 
-        visited : list
-            A sequence of visited nodes and associated generating branches in
-            the KSRM coprime pairs tree.
+        visited_nodes : list
+            A sequence of visited nodes in the KSRM coprime pairs tree.
+
+        visited_branch_ids : list
+            A sequence of the IDs of the generating branches of the visited
+            nodes, parallel to ``visited_nodes``.
 
         node_bound : int, default=None
             A bound to check that :math:`a < n` for a node :math:`(a, b)`. The
@@ -470,11 +548,13 @@ class KSRMTree:
         -------
         tuple
             A tuple consisting of the following values in order: (1) the
-            target node in the visited sequence to backtrack to, (2) the
-            associated generating branch function (the lambda for branch #1,
-            or branch #2, or branch #3), (3) the index of the target node
-            and branch pair in the visited sequence, (4) the generating
-            branch of the successor node of the target node returned as (1).
+            target node in the visited sequence to backtrack to, (2) the ID
+            of its associated generating branch (``0`` for branch #1, ``1`` for
+            branch #2, ``2`` for branch #3), (3) the index of the target node
+            in the visited sequence, (4) the ID of the generating branch of the
+            successor node of the target node returned as (1). The ID in (2) is
+            ``None`` if the target node is the root node, and the ID in (4)
+            is ``None`` if the root node is the only visited node.
 
         Examples
         --------
@@ -482,58 +562,55 @@ class KSRMTree:
         which was the successor node to :math:`(4, 1)` from the third branch.
 
         >>> tree = KSRMTree()
-        >>> tree.branches
-        (NamedCallableProxy("KSRM tree branch #1: (x, y) |--> (2x - y, x)"), NamedCallableProxy("KSRM tree branch #2: (x, y) |--> (2x + y, x)"), NamedCallableProxy("KSRM tree branch #3: (x, y) |--> (x + 2y, y)"))
-        >>> visited = [((2, 1), None), ((4, 1), tree.branches[-1]), ((6, 1), tree.branches[-1])]
-        >>> tree._backtrack(5, visited)
-        ((2, 1), None, 0, NamedCallableProxy("KSRM tree branch #3: (x, y) |--> (x + 2y, y)"))
+        >>> visited_nodes = [(2, 1), (4, 1), (6, 1)]
+        >>> visited_branch_ids = [None, 2, 2]
+        >>> tree._backtrack(5, visited_nodes, visited_branch_ids)
+        ((2, 1), None, 0, 2)
 
         An example where :math:`n = 8` and the failed node is :math:`(19, 8)`,
         which was the successor node to :math:`(8, 3)` from the first branch.
 
-        >>> tree = KSRMTree()
-        >>> tree.branches
-        (NamedCallableProxy("KSRM tree branch #1: (x, y) |--> (2x - y, x)"), NamedCallableProxy("KSRM tree branch #2: (x, y) |--> (2x + y, x)"), NamedCallableProxy("KSRM tree branch #3: (x, y) |--> (x + 2y, y)"))
-        >>> visited = [((2, 1), None), ((3, 2),tree.branches[0]), ((8, 3),tree.branches[1]), ((19, 8), tree.branches[0])]
-        >>> tree._backtrack(8, visited)
-        ((3, 2), NamedCallableProxy("KSRM tree branch #1: (x, y) |--> (2x - y, x)"), 1, NamedCallableProxy("KSRM tree branch #2: (x, y) |--> (2x + y, x)"))
+        >>> visited_nodes = [(2, 1), (3, 2), (8, 3), (19, 8)]
+        >>> visited_branch_ids = [None, 0, 1, 0]
+        >>> tree._backtrack(8, visited_nodes, visited_branch_ids)
+        ((3, 2), 0, 1, 1)
         """
         # Set the node bound for ``r``: so we require ``a < n`` for the
         # backtracked target node.
         node_bound = node_bound or n
 
-        # Set the current node and branch as the last pair in the visited
-        # sequence.
-        cur_node, cur_branch = visited[-1]
+        # Set the current node index, and the current node, as the last in
+        # the visited sequence.
+        cur_index = len(visited_nodes) - 1
+        cur_node = visited_nodes[cur_index]
 
         # If we've only visited one node it must be the root, and there is
         # no further backtracking possible, so just return appropriately.
-        if len(visited) == 1:
-            return cur_node, cur_branch, 0, None
+        if cur_index == 0:
+            return cur_node, visited_branch_ids[0], 0, None
 
-        # Otherwise do some initialisation for variables tracking the
-        # generating branch for the last visited node, and the current
-        # node index.
-        last_branch = None
-        cur_index = len(visited) - 1
+        # Otherwise do some initialisation for the variable tracking the
+        # generating branch ID for the last visited node.
+        last_branch_id = None
 
         # The main backtracking loop - while there are more nodes to backtrack
         # to, go back one node, decrement the current node index and set the
-        # current node and generating branch, and also set the generating
-        # branch of the last visited node before the current node.
+        # current node, and also set the generating branch ID of the last
+        # visited node before the current node.
         #
         # If the current node passes the test ``a < n` and we are not on the
-        # last branch, return the current node, generating branch, index
-        # and the generating branch of the last visited node before the current
-        # node.
-        while cur_index > 0 and (cur_node[0] >= node_bound or last_branch == self.branches[-1]):
+        # last branch (ID ``2``), return the current node, generating branch
+        # ID, index and the generating branch ID of the last visited node
+        # before the current node.
+        while cur_index > 0 and (cur_node[0] >= node_bound or last_branch_id == 2):
             cur_index -= 1
-            cur_node, cur_branch = visited[cur_index]
-            last_branch = visited[cur_index + 1][1]
+            cur_node = visited_nodes[cur_index]
+            last_branch_id = visited_branch_ids[cur_index + 1]
 
-        # Return the current node, generating branch, index and the generating
-        # branch of the last visited node before the current node.
-        return cur_node, cur_branch, cur_index, last_branch
+        # Return the current node, generating branch ID, index and the
+        # generating branch ID of the last visited node before the current
+        # node.
+        return cur_node, visited_branch_ids[cur_index], cur_index, last_branch_id
 
     def search_root(self, n: int, root: KSRMNode, /) -> Generator[KSRMNode, None, None]:
         """Depth-first branch-and-bound generative search function (in pre-order, NLMR), with backtracking and pruning, on the KSRM coprime pairs trees, starting from the given root node.
@@ -564,6 +641,12 @@ class KSRMTree:
            node will have untraversed children on at least one branch, and the
            traversal can begin again, as described above.
 
+        As the first components of the children of a node :math:`(a, b)` on
+        the first two branches are :math:`2a - b < 2a + b`, if the child on
+        either of these branches fails the check :math:`a \\leq n` the search
+        switches directly to the third branch of the node, without generating
+        the failed child nodes or backtracking.
+
         Parameters
         ----------
         n : int
@@ -616,8 +699,18 @@ class KSRMTree:
         if n < root[0]:
             return
 
-        # A stack to store visited nodes and their generating branches.
-        visited = []
+        # Bind the underlying callables of the three generating branches,
+        # indexed by branch ID, so that generating a node is a direct call
+        # and not through the ``NamedCallableProxy.__call__`` wrapper.
+        branches = tuple(branch.callable for branch in self._branches)
+
+        # Two parallel stacks to store visited nodes and the (integer) IDs of
+        # their generating branches - these are the indices ``0``, ``1``, ``2``
+        # of the branches in ``self.branches``, with ``None`` for the root.
+        # Using parallel stacks avoids allocating a (node, branch) pair for
+        # every visited node.
+        visited_nodes: list[KSRMNode] = []
+        visited_branch_ids: list[int | None] = []
 
         # A counter to store the number of nodes searched (or visited) -
         # useful for debugging and also for optimising the search
@@ -625,12 +718,13 @@ class KSRMTree:
         num_nodes_searched = 0
 
         # Start at the root, initialising variables for the current node
-        # and generating branch to that of the root node, and also 
-        # initialising a variable to store the generating branch of the
+        # and generating branch ID to that of the root node, and also 
+        # initialising a variable to store the generating branch ID of the
         # successor node of the current node.
         cur_node = root
-        cur_branch = last_branch = None
-        visited.append((cur_node, cur_branch))
+        cur_branch_id = last_branch_id = None
+        visited_nodes.append(cur_node)
+        visited_branch_ids.append(cur_branch_id)
         num_nodes_searched += 1
 
         # Generate the root
@@ -641,20 +735,35 @@ class KSRMTree:
         while True:
             # If starting from either root, which do not have generating
             # branches, set the current branch to branch #1.
-            if cur_branch is None:
-                cur_branch = self.branches[0]
+            if cur_branch_id is None:
+                cur_branch_id = 0
+
+            # Prune before generating: the first components of the children
+            # of ``(a, b)`` on branches #1 and #2 are ``2a - b < 2a + b``, so
+            # if the one on the current branch (#1 or #2) exceeds ``n`` then so
+            # does the one on branch #2, and the search can switch directly to
+            # branch #3 of the current node, without generating the failed
+            # node(s) and backtracking to the current node. This requires
+            # ``a < n``, otherwise no child of the current node can satisfy
+            # the bound and the usual backtracking applies.
+            a, b = cur_node
+            if cur_branch_id < 2 and a < n and (2 * a + b if cur_branch_id else 2 * a - b) > n:
+                last_branch_id = 1
+                cur_branch_id = 2
+                continue
 
             # Generate and visit the next node ``(a, b)``, where ``1 <= b < a``
             # and ``gcd(a, b) = 1`` is guaranteed by the nature of the
             # generating branches.
-            cur_node = cur_branch(*cur_node)
-            visited.append((cur_node, cur_branch))
+            cur_node = branches[cur_branch_id](a, b)
+            visited_nodes.append(cur_node)
+            visited_branch_ids.append(cur_branch_id)
             num_nodes_searched += 1
 
             # If the node satisfies ``a <= n`` and generate it, then update the
-            # variable storing the generating branch of the successor node of
-            # the current node, and set the current (next generating) branch to
-            # branch #1, and continue the DFS.
+            # variable storing the generating branch ID of the successor node
+            # of the current node, and set the current (next generating) branch
+            # to branch #1, and continue the DFS.
             #
             # If the node does not satisfy ``a <= n`` backtrack to the nearest
             # satisfying non-root node, prune any unnecessary nodes as needed,
@@ -663,32 +772,35 @@ class KSRMTree:
             # been explored the DFS has ended, and so exit.
             if cur_node[0] <= n:
                 yield cur_node
-                last_branch = cur_branch
-                cur_branch = self.branches[0]
+                last_branch_id = cur_branch_id
+                cur_branch_id = 0
                 continue
             else:
                 # Backtrack to the nearest satisfying target node, which will
-                # become the current node; the current branch and current
+                # become the current node; the current branch ID and current
                 # node index are also updated, as is the variable storing the
-                # generating branch of the successor node of the target/current
-                # node.
-                cur_node, cur_branch, cur_index, last_branch = self._backtrack(n, visited, node_bound=n)
+                # generating branch ID of the successor node of the
+                # target/current node.
+                cur_node, cur_branch_id, cur_index, last_branch_id = self._backtrack(
+                    n, visited_nodes, visited_branch_ids, node_bound=n
+                )
 
                 # Prune all visited intermediate nodes after the backtracked
                 # target node leading up to the failed node, including the
                 # failed node.
-                visited[cur_index + 1:] = []
+                del visited_nodes[cur_index + 1:]
+                del visited_branch_ids[cur_index + 1:]
 
                 # If we've reached the root node, and it has no untraversed
                 # children, then we've finished our DFS, so return.
-                if cur_node == root and last_branch == self.branches[-1]:
+                if cur_node == root and last_branch_id == 2:
                     return
 
                 # Otherwise, switch to the generating branch of the "next"
                 # child node - branch #2 if the current branch is branch #1, or
                 # branch #3 if the current branch is #2 - and continue the
                 # search.
-                cur_branch = self.branches[1] if last_branch == self.branches[0] else self.branches[-1]
+                cur_branch_id = 1 if last_branch_id == 0 else 2
                 continue
 
         # Not strictly required, but this has been inserted to make
@@ -754,7 +866,90 @@ class KSRMTree:
 
         if n > 2:
             yield from self.search_root(n - 1, self.roots[1])
-            yield from tuple(product([n], coprime_integers(n)))
+            # ``coprime_integers`` is cached, so the last row of pairs can be
+            # yielded directly from it without materialising another tuple
+            yield from product((n,), coprime_integers(n))
+
+    def search_cached(self, n: int, /) -> Generator[KSRMNode, None, None]:
+        """Memoized version of :py:meth:`~continuedfractions.sequences.KSRMTree.search`.
+
+        Yields the same coprime pairs, in the same order, as
+        :py:meth:`~continuedfractions.sequences.KSRMTree.search`, but repeat
+        searches for a recently used :math:`n` are served from a module-level
+        cache, shared by all trees, instead of redoing the depth-first search.
+        As the number of coprime pairs grows quadratically in :math:`n`, the
+        cache is bounded to the eight most recently used values of :math:`n`.
+
+        Parameters
+        ----------
+        n : int
+            The positive integer for which coprime pairs :math:`(a, b)`, with
+            :math:`1 \\leq b < a \\leq n`, are sought.
+
+        Raises
+        ------
+        ValueError
+            If ``n`` is not an integer or is :math:`< 1`.
+
+        Yields
+        ------
+        tuple
+            Pairs of coprime integers :math:`(a, b)`, with
+            :math:`1 \\leq b < a \\leq n`.
+
+        Examples
+        --------
+        >>> tree = KSRMTree()
+        >>> list(tree.search_cached("not an integer"))
+        Traceback (most recent call last):
+        ...
+        ValueError: `n` must be a positive integer >= 1
+        >>> list(tree.search_cached([3]))
+        Traceback (most recent call last):
+        ...
+        ValueError: `n` must be a positive integer >= 1
+        >>> list(tree.search_cached(1))
+        [(1, 1)]
+        >>> list(tree.search_cached(5))
+        [(1, 1), (2, 1), (3, 2), (4, 3), (4, 1), (3, 1), (5, 4), (5, 3), (5, 2), (5, 1)]
+        """
+        if not isinstance(n, int) or n < 1:
+            raise ValueError("`n` must be a positive integer >= 1")
+
+        yield from _ksrm_search_cached(n)
+
+
+@functools.lru_cache(maxsize=8)
+def _ksrm_search_cached(n: int, /) -> tuple[KSRMNode]:
+    """Private, memoized version of :py:meth:`~continuedfractions.sequences.KSRMTree.search` which returns the search results as a tuple.
+
+    The cache is keyed on :math:`n` only, as :py:class:`~continuedfractions.sequences.KSRMTree`
+    objects are stateless, and is bounded to the eight most recently used
+    values of :math:`n`. As it is only called internally, by
+    :py:meth:`~continuedfractions.sequences.KSRMTree.search_cached`, there is
+    no input validation.
+
+    Parameters
+    ----------
+    n : int
+        The positive integer for which coprime pairs :math:`(a, b)`, with
+        :math:`1 \\leq b < a \\leq n`, are sought.
+
+    Returns
+    -------
+    tuple
+        A :py:class:`tuple` of pairs of coprime integers :math:`(a, b)`,
+        with :math:`1 \\leq b < a \\leq n`, in the same order as
+        :py:meth:`~continuedfractions.sequences.KSRMTree.search`.
+
+    Examples
+    --------
+    >>> _ksrm_search_cached(5)
+    ((1, 1), (2, 1), (3, 2), (4, 3), (4, 1), (3, 1), (5, 4), (5, 3), (5, 2), (5, 1))
+    >>> _ksrm_search_cached(5) is _ksrm_search_cached(5)
+    True
+    """
+    return tuple(KSRMTree().search(n))
 
 
 def coprime_pairs_generator(n: int, /) -> Generator[KSRMNode, None, None]:
@@ -807,10 +1002,8 @@ def coprime_pairs_generator(n: int, /) -> Generator[KSRMNode, None, None]:
     if n == 1:
         yield (1, 1)
     else:
-        yield from chain(
-            KSRMTree().search(n - 1),
-            product([n], coprime_integers(n))
-        )
+        yield from KSRMTree().search(n - 1)
+        yield from product((n,), coprime_integers(n))
 
 
 @functools.cache
@@ -862,6 +1055,12 @@ def farey_sequence_generator(n: int, /) -> Generator[ContinuedFraction, None, No
     :py:class:`~continuedfractions.continuedfraction.ContinuedFraction`
     instances, in ascending order of magnitude.
 
+    The terms are generated directly in order, starting from
+    :math:`\\frac{0}{1}, \\frac{1}{n}`, using the recurrence which gives the
+    term following two consecutive terms :math:`\\frac{a}{b}, \\frac{c}{d}`
+    as :math:`\\frac{kc - a}{kd - b}`, where
+    :math:`k = \\left\\lfloor \\frac{n + b}{d} \\right\\rfloor`.
+
     See the `documentation <https://continuedfractions.readthedocs.io/en/latest/sources/sequences.html#sequences-farey-sequences>`_
     for more details.
 
@@ -899,18 +1098,17 @@ def farey_sequence_generator(n: int, /) -> Generator[ContinuedFraction, None, No
     if not isinstance(n, int) or n < 1:
         raise ValueError("`n` must be a positive integer >= 1")
 
-    if n == 1:
-        yield from (ContinuedFraction(0, 1), ContinuedFraction(1, 1))
-    else:
-        yield from chain(
-            (ContinuedFraction(0, 1),),
-            sorted(
-                starmap(
-                    ContinuedFraction,
-                    starmap(lambda *x: tuple(reversed(x)), coprime_pairs(n))
-                )
-            )
-        )
+    # ``a / b`` and ``c / d`` are always two consecutive terms, and the
+    # next-term recurrence produces the terms in order, so no sorting is
+    # required - the terms are always reduced, so their elements can be
+    # computed lazily, only if they are used
+    a, b, c, d = 0, 1, 1, n
+    yield ContinuedFraction._from_reduced(a, b)
+
+    while c <= n:
+        k = (n + b) // d
+        a, b, c, d = c, d, k * c - a, k * d - b
+        yield ContinuedFraction._from_reduced(a, b)
 
 
 @functools.cache
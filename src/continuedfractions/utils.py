@@ -16,6 +16,50 @@ from typing import Any, Callable
 # -- Internal libraries --
 
 
+def _constant_key(constant: Any, /) -> Any:
+    """Returns a key for a code object constant which distinguishes constants of different types that are equal in value.
+
+    A private function for
+    :py:class:`~continuedfractions.utils.NamedCallableProxy` equality and
+    hashing. Constants are keyed by type as well as value, floats and
+    complex numbers by their representations, so that ``0.0`` and ``-0.0``
+    are distinguished, and tuples and frozensets of constants recursively.
+
+    Parameters
+    ----------
+    constant : object
+        A constant from the ``co_consts`` of a code object.
+
+    Returns
+    -------
+    object
+        A hashable key for the constant.
+
+    Examples
+    --------
+    >>> _constant_key(1) == _constant_key(1)
+    True
+    >>> _constant_key(1) == _constant_key(1.0)
+    False
+    >>> _constant_key(1) == _constant_key(True)
+    False
+    >>> _constant_key(0.0) == _constant_key(-0.0)
+    False
+    >>> _constant_key((1, (2.0,))) == _constant_key((1, (2,)))
+    False
+    """
+    if isinstance(constant, tuple):
+        return tuple, tuple(map(_constant_key, constant))
+
+    if isinstance(constant, frozenset):
+        return frozenset, frozenset(map(_constant_key, constant))
+
+    if isinstance(constant, (float, complex)):
+        return type(constant), repr(constant)
+
+    return type(constant), constant
+
+
 class NamedCallableProxy:
     """Class wrapper to have named callable proxies, which can also work as :py:class:`enum.Enum` values.
 
@@ -23,10 +67,11 @@ class NamedCallableProxy:
 
         https://stackoverflow.com/a/40486992
     """
-    __slots__ = ('_callable', '_name')
+    __slots__ = ('_callable', '_name', '_code')
 
     _callable: Callable
     _name: str
+    _code: tuple
 
     def __new__(cls, callable_: Callable, /, *, name: str = None) -> NamedCallableProxy:
         """Constructor
@@ -57,6 +102,16 @@ class NamedCallableProxy:
         self._callable = callable_
         self._name = name
 
+        # Cache the bytecode, constants (keyed by type as well as value) and
+        # names of the callable, which is what equality and hashing are based
+        # on - callables without a code object, such as builtins, fall back
+        # to the callable itself
+        try:
+            code = callable_.__code__
+            self._code = (code.co_code, _constant_key(code.co_consts), code.co_names)
+        except AttributeError:
+            self._code = (callable_,)
+
         return self
 
     def __repr__(self) -> str:
@@ -66,11 +121,31 @@ class NamedCallableProxy:
         return str(self._callable)
 
     def __eq__(self, other: NamedCallableProxy) -> bool:
-        return self._callable.__code__.co_code == other._callable.__code__.co_code
+        return self._code == other._code
+
+    def __hash__(self) -> int:
+        return hash(self._code)
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         return self._callable(*args, **kwargs)
 
+    @property
+    def callable(self) -> Callable:
+        """:py:class:`callable`: The underlying callable.
+
+        Calling this directly avoids the overhead of the general
+        ``*args, **kwargs`` call proxying, which is useful in hot loops.
+
+        Examples
+        --------
+        >>> square = NamedCallableProxy(lambda x: x ** 2, name="square: x |--> x^2")
+        >>> square.callable(3)
+        9
+        >>> square.callable is square._callable
+        True
+        """
+        return self._callable
+
 
 if __name__ == "__main__":      # pragma: no cover
     # Doctest the module from the project root using
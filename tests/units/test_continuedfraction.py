@@ -4,28 +4,41 @@
 
 import decimal
 
-# Set the :py:mod:`decimal` context for the test computations in this module
-# using default precision of 28 digits, including the integer part, and 
-# set the :py:class:`decimal.Inexact` trap for computations to signal
-# loss of precision due to rounding - this would be useful in debugging
-context = decimal.Context(prec=28, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
-context.traps[decimal.Inexact] = True
-decimal.setcontext(context)
-
 from decimal import Decimal
 from fractions import Fraction
-from types import MappingProxyType
 
 # -- 3rd party libraries --
 import pytest
 
 # -- Internal libraries --
-from continuedfractions.lib import convergent
+from continuedfractions import continuedfraction
+from continuedfractions.lib import continued_fraction_rational, convergent
 from continuedfractions.continuedfraction import ContinuedFraction
 
 
 class TestContinuedFraction:
 
+    @pytest.fixture(autouse=True)
+    def decimal_context(self):
+        # Set a local :py:mod:`decimal` context for the test computations in
+        # this class using default precision of 28 digits, including the
+        # integer part, and set the :py:class:`decimal.Inexact` trap for
+        # computations to signal loss of precision due to rounding - this
+        # would be useful in debugging. The context is restored after each
+        # test, so that tests in other modules are not affected.
+        with decimal.localcontext() as context:
+            context.prec = 28
+            context.Emax = decimal.MAX_EMAX
+            context.Emin = decimal.MIN_EMIN
+            context.traps[decimal.Inexact] = True
+            yield context
+
+    @pytest.fixture(scope="class")
+    def test_cf(self):
+        # A continued fraction shared by the semiconvergent tests, which do
+        # not mutate it
+        return ContinuedFraction(-415, 93)
+
     @pytest.mark.parametrize(
         """valid_inputs,
            expected_fraction_obj,
@@ -423,6 +436,7 @@ class TestContinuedFraction:
                 Decimal('0.7271927710843373493975903614')
             ),
         ],
+        ids=[f"case{i}" for i in range(1, 22)],
     )
     def test_ContinuedFraction__creation_and_initialisation__valid_inputs__object_correctly_created_and_initialised(
         self,
@@ -450,11 +464,12 @@ class TestContinuedFraction:
         # Compare the float values
         assert received.as_float() == expected_float_value
 
-        # Compare the decimal values
-        try:
+        # Compare the decimal values - the ``Inexact`` trap is disabled for
+        # this, as the decimal values of fractions whose denominators have
+        # prime factors other than ``2`` and ``5`` are necessarily rounded
+        with decimal.localcontext() as context:
+            context.traps[decimal.Inexact] = False
             assert received.as_decimal() == expected_decimal_value
-        except decimal.Inexact:
-            pass
 
         # Compare the element sequences
         assert received.elements == expected_elements
@@ -462,23 +477,26 @@ class TestContinuedFraction:
         # Compare the orders
         assert received.order == expected_order
 
-        # Compare the Khinchin means
-        assert received.khinchin_mean == expected_khinchin_mean
+        # Compare the Khinchin means - these are null for integer-valued
+        # continued fractions, i.e. of order ``0``
+        if expected_khinchin_mean is None:
+            assert received.khinchin_mean is None
+        else:
+            assert received.khinchin_mean == expected_khinchin_mean
 
         # Compare the convergents using the ``.convergent`` method
-        assert not any(
-            received.convergent(k) != expected_convergents[k][1]
-            for k in range(received.order + 1)
-        )
+        assert tuple(
+            (k, received.convergent(k)) for k in range(received.order + 1)
+        ) == expected_convergents
 
         # Compare the convergents using the ``.convergents`` property
         assert tuple(received.convergents) == expected_convergents
 
         # Compare the even-order convergents using the ``.even_order_convergents` property
-        assert tuple(received.even_convergents) == tuple((k, expected_convergents[k][1]) for k in range(0, received.order + 1, 2))
+        assert tuple(received.even_convergents) == expected_convergents[::2]
 
         # Compare the order-order convergents using the ``.odd_order_convergents` property
-        assert tuple(received.odd_convergents) == tuple((k, expected_convergents[k][1]) for k in range(1, received.order + 1, 2))
+        assert tuple(received.odd_convergents) == expected_convergents[1::2]
 
         # Compare the 2nd order right- and left-mediants, and also the simple
         # mediant, using a reference continued fraction of ``1/1``
@@ -488,16 +506,16 @@ class TestContinuedFraction:
 
         expected_remainders = tuple(
             (k, ContinuedFraction.from_elements(*expected_elements[k:]))
-            for k in reversed(range(received.order + 1))
+            for k in range(received.order + 1)
         )
         # Compare the remainders using the ``.remainder`` method
-        assert all(
-            received.remainder(k) == expected_remainders[::-1][k][1]
-            for k in reversed(range(received.order + 1))
-        )
+        assert tuple(
+            (k, received.remainder(k)) for k in range(received.order + 1)
+        ) == expected_remainders
 
-        # Compare the remainders using the ``.remainders`` property
-        assert tuple(received.remainders) == expected_remainders
+        # Compare the remainders using the ``.remainders`` property, which
+        # generates them in reverse order
+        assert tuple(received.remainders) == expected_remainders[::-1]
 
     @pytest.mark.parametrize(
         "invalid_elements",
@@ -520,7 +538,7 @@ class TestContinuedFraction:
         ]
     )
     def test_ContinuedFraction__from_elements__invalid_elements__value_error_raised(self, invalid_elements):
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match=r"^Continued fraction elements must be integers, and all elements after the 1st"):
             ContinuedFraction.from_elements(*invalid_elements)
 
     @pytest.mark.parametrize(
@@ -555,7 +573,7 @@ class TestContinuedFraction:
         ],
     )
     def test_ContinuedFraction__extend__invalid_elements__value_error_raised(self, instance, invalid_elements):
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match=r"^The elements/coefficients to be added to the tail"):
             instance.extend(*invalid_elements)
 
     @pytest.mark.parametrize(
@@ -599,7 +617,7 @@ class TestContinuedFraction:
         ],
     )
     def test_ContinuedFraction__truncate__invalid_elements__value_error_raised(self, instance, invalid_elements):
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match=r"^The elements/coefficients to be truncated from the tail"):
             instance.truncate(*invalid_elements)
 
     @pytest.mark.parametrize(
@@ -713,10 +731,8 @@ class TestContinuedFraction:
             (5, 1),
         ]
     )
-    def test_ContinuedFraction__semiconvergent__invalid_args(self, k, m):
-        test_cf = ContinuedFraction(-415, 93)
-
-        with pytest.raises(ValueError):
+    def test_ContinuedFraction__semiconvergent__invalid_args(self, test_cf, k, m):
+        with pytest.raises(ValueError, match=r"^`k` and `m` must be positive integers"):
             test_cf.semiconvergent(k, m)
 
     @pytest.mark.parametrize(
@@ -734,12 +750,34 @@ class TestContinuedFraction:
             (4, 4, ContinuedFraction(-1718, 385)),
         ]
     )
-    def test_ContinuedFraction__semiconvergent__valid_args__correct_semiconvergent_returned(self, k, m, expected_semiconvergent):
-        test_cf = ContinuedFraction(-415, 93)
-
+    def test_ContinuedFraction__semiconvergent__valid_args__correct_semiconvergent_returned(self, test_cf, k, m, expected_semiconvergent):
         assert test_cf.semiconvergent(k, m) == expected_semiconvergent
         assert test_cf.semiconvergent(k, m) == test_cf.convergent(k - 1).right_mediant(test_cf.convergent(k), k=m)
 
+    def test_ContinuedFraction__elements__lazily_computed(self, monkeypatch):
+        calls = []
+
+        def counting_continued_fraction_rational(x):
+            calls.append(x)
+            return continued_fraction_rational(x)
+
+        monkeypatch.setattr(continuedfraction, 'continued_fraction_rational', counting_continued_fraction_rational)
+
+        # The public constructor computes the elements on construction
+        cf = ContinuedFraction(-649, 200)
+        assert calls == [cf]
+        assert cf.elements == (-4, 1, 3, 12, 4)
+        assert len(calls) == 1
+
+        # The private constructor defers it until the elements are first
+        # used, and computes them only once
+        calls.clear()
+        cf = ContinuedFraction._from_reduced(-649, 200)
+        assert calls == []
+        assert cf.elements == (-4, 1, 3, 12, 4)
+        assert cf.elements == (-4, 1, 3, 12, 4)
+        assert len(calls) == 1
+
     def test_ContinuedFraction__rational_operations(self):
         f0 = ContinuedFraction(2, 1)
         f1 = ContinuedFraction(649, 200)
@@ -759,7 +797,7 @@ class TestContinuedFraction:
 
         assert f1 + f2 == ContinuedFraction(0, 1)
 
-        assert f1 + 1 == 1 + f1 == ContinuedFraction('4.245')
+        assert f1 + 1 == 1 + f1 == ContinuedFraction(849, 200)
 
         assert f1.__radd__(f2) == f2.__radd__(f1)
 
@@ -767,13 +805,13 @@ class TestContinuedFraction:
 
         assert f1 - f2 == ContinuedFraction(649, 100)
 
-        assert f1 - 1 == ContinuedFraction('2.245')
+        assert f1 - 1 == ContinuedFraction(449, 200)
 
-        assert 1 - f1 == f1.__rsub__(1) == ContinuedFraction('-2.245')
+        assert 1 - f1 == f1.__rsub__(1) == ContinuedFraction(-449, 200)
 
-        assert f1 - 4 == ContinuedFraction('-0.755')
+        assert f1 - 4 == ContinuedFraction(-151, 200)
 
-        assert 4 - f1 == ContinuedFraction('0.755')
+        assert 4 - f1 == ContinuedFraction(151, 200)
 
         assert f1.__rsub__(f2) == f2.__radd__(-f1)
 
@@ -25,18 +25,18 @@ class TestContinuedFractionRational:
 	@pytest.mark.parametrize(
 	    "r, elements",
 	    [
-	        (Fraction(3, 2), tuple([1, 2])),
-	        (Fraction(-5000), tuple([-5000])),
-	        (Fraction(649, 200), tuple([3, 4, 12, 4])),
-	        (Fraction(-649, 200), tuple([-4, 1, 3, 12, 4])),
-	        (Fraction(-649, -200), tuple([3, 4, 12, 4])),
-	        (Fraction(-1, 3), tuple([-1, 1, 2])),
-	        (Fraction(1, 3), tuple([0, 3])),
-	        (Fraction(415, 93), tuple([4, 2, 6, 7])),
-	        (Fraction(415, -93), tuple([-5, 1, 1, 6, 7])),
-	        (Fraction(10, 100), tuple([0, 10])),
-	        (Fraction(-95, 82), tuple([-2, 1, 5, 3, 4])),
-	        (Fraction(356, 103), tuple([3, 2, 5, 4, 2]))
+	        (Fraction(3, 2), (1, 2,)),
+	        (Fraction(-5000), (-5000,)),
+	        (Fraction(649, 200), (3, 4, 12, 4,)),
+	        (Fraction(-649, 200), (-4, 1, 3, 12, 4,)),
+	        (Fraction(-649, -200), (3, 4, 12, 4,)),
+	        (Fraction(-1, 3), (-1, 1, 2,)),
+	        (Fraction(1, 3), (0, 3,)),
+	        (Fraction(415, 93), (4, 2, 6, 7,)),
+	        (Fraction(415, -93), (-5, 1, 1, 6, 7,)),
+	        (Fraction(10, 100), (0, 10,)),
+	        (Fraction(-95, 82), (-2, 1, 5, 3, 4,)),
+	        (Fraction(356, 103), (3, 2, 5, 4, 2,))
 	    ],
 	)
 	def test_continued_fraction_rational__valid_integers__correct_elements_generated(self, r, elements):
@@ -97,7 +97,7 @@ class TestFractionFromElements:
 	    ],
 	)
 	def test_fraction_from_elements__invalid_elements__value_error_raised(self, elements):
-		with pytest.raises(ValueError):
+		with pytest.raises(ValueError, match=r"^Continued fraction elements must be integers"):
 			fraction_from_elements(*elements)
 
 	@pytest.mark.parametrize(
@@ -141,7 +141,7 @@ class TestConvergent:
 	    ],
 	)
 	def test_convergent__invalid_elements__value_error_raised(self, k, elements):
-		with pytest.raises(ValueError):
+		with pytest.raises(ValueError, match=r"^`k` must be a non-negative integer"):
 			convergent(k, *elements)
 
 	@pytest.mark.parametrize(
@@ -188,7 +188,7 @@ class TestConvergents:
 		]
 	)
 	def test_convergents__invalid_elements__value_error_raised(self, invalid_elements):
-		with pytest.raises(ValueError):
+		with pytest.raises(ValueError, match=r"^Continued fraction elements must be integers, and all"):
 			list(convergents(*invalid_elements))
 	@pytest.mark.parametrize(
 		"in_elements, expected_convergents",
@@ -226,7 +226,7 @@ class TestRemainder:
 	    ],
 	)
 	def test_remainder__invalid_elements__value_error_raised(self, k, elements):
-		with pytest.raises(ValueError):
+		with pytest.raises(ValueError, match=r"^`k` must be a non-negative integer"):
 			remainder(k, *elements)
 
 	@pytest.mark.parametrize(
@@ -277,7 +277,7 @@ class TestRemainders:
 		]
 	)
 	def test_remainders__invalid_elements__value_error_raised(self, invalid_elements):
-		with pytest.raises(ValueError):
+		with pytest.raises(ValueError, match=r"^Continued fraction elements must be integers, and all"):
 			tuple(remainders(*invalid_elements))
 
 	@pytest.mark.parametrize(
@@ -314,7 +314,7 @@ class TestMediant:
 		]
 	)
 	def test_mediant__invalid_dir_or_order__value_error_raised(self, rational1, rational2, dir, k):
-		with pytest.raises(ValueError):
+		with pytest.raises(ValueError, match=r"^The mediant direction must be 'left' or 'right'"):
 			mediant(rational1, rational2, dir=dir, k=k)
 
 	@pytest.mark.parametrize(
@@ -338,6 +338,7 @@ class TestMediant:
 	        (Fraction(-1, 2), Fraction(1, -2), 1, Fraction(-1, 2)),
 	        (Fraction(-1, 2), Fraction(1, -2), 2, Fraction(-1, 2)),
 	        (Fraction(1, 2), Fraction(3, 5), 10 ** 6, Fraction(1000003, 2000005)),
+	        (Fraction(1, 2), Fraction(3, 5), 10 ** 9, Fraction(1000000003, 2000000005)),
 	    ],
 	)
 	def test_left_mediant__two_ordered_rationals__correct_mediant_returned(self, rational1, rational2, k, expected_mediant):
@@ -357,6 +358,7 @@ class TestMediant:
 	        (Fraction(-1, 2), Fraction(-1), 'right', 1, Fraction(-2, 3)),
 	        (Fraction(-1, 2), Fraction(1, -2), 'right', 1, Fraction(-1, 2)),
 	        (Fraction(1, 2), Fraction(3, 5), 'right', 10 ** 6, Fraction(3000001, 5000002)),
+	        (Fraction(1, 2), Fraction(3, 5), 'right', 10 ** 9, Fraction(3000000001, 5000000002)),
 	    ],
 	)
 	def test_right_mediant__two_ordered_rationals__correct_mediant_returned(self, rational1, rational2, dir_, k, expected_mediant):
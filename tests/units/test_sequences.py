@@ -1,6 +1,7 @@
 # -- IMPORTS --
 
 # -- Standard libraries --
+import math
 
 # -- 3rd party libraries --
 import pytest
@@ -10,6 +11,7 @@ import sympy
 from continuedfractions.continuedfraction import ContinuedFraction
 from continuedfractions.utils import NamedCallableProxy
 from continuedfractions.sequences import (
+    _prime_factors,
     coprime_integers,
     coprime_pairs,
     farey_sequence,
@@ -17,6 +19,32 @@ from continuedfractions.sequences import (
 )
 
 
+class TestPrimeFactors:
+
+    @pytest.mark.parametrize(
+        "n",
+        [
+            1,
+            2,
+            3,
+            4,
+            12,
+            97,
+            1001,
+            9999,
+            10000,
+            65536,
+            999999,
+            1000001,
+            9999999,
+            10000000,
+            10000001,
+        ]
+    )
+    def test__prime_factors__verify_against_sympy_primefactors(self, n):
+        assert _prime_factors(n) == tuple(sympy.primefactors(n))
+
+
 class TestCoprimeIntegers:
 
     @pytest.mark.parametrize(
@@ -31,7 +59,7 @@ class TestCoprimeIntegers:
         ]
     )
     def test_coprime_integers__invalid_args__raises_value_error(self, n, start, stop):
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match=r"^`n` must be a positive integer; if `n` > 1 then the `start` value"):
             coprime_integers(n, start=start, stop=stop)
 
     @pytest.mark.parametrize(
@@ -198,6 +226,24 @@ class TestCoprimeIntegers:
 
         assert len(received) == expected
 
+    @pytest.mark.parametrize(
+        "n, start, stop",
+        [
+            (10 ** 8, 10 ** 8 - 20, None),
+            (10 ** 12 + 39, 10 ** 12 + 34, None),
+            (10 ** 12 + 39, 10 ** 12 - 10 ** 5, 10 ** 12 + 1),
+            (510510, 1, None),
+            (510510, 65537, 262143),
+            (2 ** 20, 3, 2 ** 20 - 1),
+        ]
+    )
+    def test_coprime_integers__verify_against_gcd(self, n, start, stop):
+        expected = tuple(m for m in range(stop or n, start - 1, -1) if math.gcd(m, n) == 1)
+
+        received = coprime_integers(n, start=start, stop=stop)
+
+        assert received == expected
+
 
 class TestKSRMTree:
 
@@ -214,61 +260,44 @@ class TestKSRMTree:
 
     @pytest.mark.parametrize(
         """n,
-           visited,
+           visited_nodes,
+           visited_branch_ids,
            expected_backtracked_tuple""",
         [
             # Case #1
             (
                 3,
-                [
-                    ((2, 1), None),
-                ],
+                [(2, 1)],
+                [None],
                 ((2, 1), None, 0, None),
             ),
             # Case #2
             (
                 5,
-                [
-                    ((2, 1), None),
-                    ((4, 1), NamedCallableProxy(lambda x, y: (x + 2 * y, y))),
-                    ((6, 1), NamedCallableProxy(lambda x, y: (x + 2 * y, y)))
-                ],
-                ((2, 1), None, 0, NamedCallableProxy(lambda x, y: (x + 2 * y, y))),
+                [(2, 1), (4, 1), (6, 1)],
+                [None, 2, 2],
+                ((2, 1), None, 0, 2),
             ),
             # Case #3
             (
                 8,
-                [
-                    ((2, 1), None),
-                    ((3, 2), NamedCallableProxy(lambda x, y: (2 * x - y, x))),
-                    ((8, 3), NamedCallableProxy(lambda x, y: (2 * x + y, x))),
-                    ((19, 8), NamedCallableProxy(lambda x, y: (2 * x - y, x))),
-                ],
-                ((3, 2), NamedCallableProxy(lambda x, y: (2 * x - y, x)), 1, NamedCallableProxy(lambda x, y: (2 * x + y, x))),
+                [(2, 1), (3, 2), (8, 3), (19, 8)],
+                [None, 0, 1, 0],
+                ((3, 2), 0, 1, 1),
             ),
             # Case #4
             (
                 10,
-                [
-                    ((2, 1), None),
-                    ((3, 2), NamedCallableProxy(lambda x, y: (2 * x - y, x))),
-                    ((4, 3), NamedCallableProxy(lambda x, y: (2 * x - y, x))),
-                    ((5, 4), NamedCallableProxy(lambda x, y: (2 * x - y, x))),
-                    ((6, 5), NamedCallableProxy(lambda x, y: (2 * x - y, x))),
-                    ((7, 6), NamedCallableProxy(lambda x, y: (2 * x - y, x))),
-                    ((8, 7), NamedCallableProxy(lambda x, y: (2 * x - y, x))),
-                    ((9, 8), NamedCallableProxy(lambda x, y: (2 * x - y, x))),
-                    ((10, 9), NamedCallableProxy(lambda x, y: (2 * x - y, x))),
-                    ((28, 9), NamedCallableProxy(lambda x, y: (x + 2 * y, y))),
-                ],
-                ((9, 8), NamedCallableProxy(lambda x, y: (2 * x - y, x)), 7, NamedCallableProxy(lambda x, y: (2 * x - y, x))),
+                [(2, 1), (3, 2), (4, 3), (5, 4), (6, 5), (7, 6), (8, 7), (9, 8), (10, 9), (28, 9)],
+                [None, 0, 0, 0, 0, 0, 0, 0, 0, 2],
+                ((9, 8), 0, 7, 0),
             )
         ],
     )
-    def test_KSRMTree__backtrack(self, n, visited, expected_backtracked_tuple):
+    def test_KSRMTree__backtrack(self, n, visited_nodes, visited_branch_ids, expected_backtracked_tuple):
         expected = expected_backtracked_tuple
 
-        received = KSRMTree()._backtrack(n, visited)
+        received = KSRMTree()._backtrack(n, visited_nodes, visited_branch_ids)
 
         assert received == expected
 
@@ -284,7 +313,7 @@ class TestKSRMTree:
         ]
     )
     def test_KSRMTree_search_root__invalid_args__raises_value_error(self, n, root):
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match=r"^`n` must be a positive integer >= 2, and `root` must be a coprime pair"):
             list(KSRMTree().search_root(n, root))
 
     @pytest.mark.parametrize(
@@ -390,13 +419,17 @@ class TestKSRMTree:
             ("not an integer",),
             (0,),
             (-1, ),
-            (0.1,)
+            (0.1,),
+            [3],
         ]
     )
     def test_KSRMTree_search__invalid_args__raises_value_error(self, n):
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match=r"^`n` must be a positive integer >= 1"):
             list(KSRMTree().search(n))
 
+        with pytest.raises(ValueError, match=r"^`n` must be a positive integer >= 1"):
+            list(KSRMTree().search_cached(n))
+
     @pytest.mark.parametrize(
         """n,
            expected_pairs""",
@@ -454,10 +487,20 @@ class TestKSRMTree:
     def test_KSRMTree_search(self, n, expected_pairs):
         expected = expected_pairs
 
-        received = list(KSRMTree().search(n))
+        tree = KSRMTree()
+
+        received = list(tree.search(n))
 
         assert received == expected
 
+        # The memoized search should yield the same pairs, both on the first
+        # and on repeat calls
+        assert list(tree.search_cached(n)) == expected
+        assert list(tree.search_cached(n)) == expected
+
+        # The cache is keyed on ``n`` only, so fresh trees share it
+        assert list(KSRMTree().search_cached(n)) == expected
+
 
 class TestCoprimePairs:
 
@@ -471,7 +514,7 @@ class TestCoprimePairs:
         ]
     )
     def test_coprime_pairs__invalid_args__raises_value_error(self, n):
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match=r"^`n` must be a positive integer >= 1"):
             coprime_pairs(n)
 
     @pytest.mark.parametrize(
@@ -573,7 +616,7 @@ class TestFareySequence:
         ]
     )
     def test_farey_sequence__invalid_args__raises_value_error(self, n):
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match=r"^`n` must be a positive integer >= 1"):
             farey_sequence(n)
 
     @pytest.mark.parametrize(
@@ -46,6 +46,9 @@ class TestNamedCallableProxy:
 		# Compare the received and expected objects
 		assert received == expected
 
+		# Compare the hashes
+		assert hash(received) == hash(expected)
+
 		# Compare the names
 		assert received._name == expected._name
 
@@ -58,3 +61,26 @@ class TestNamedCallableProxy:
 		assert received(1) == expected(1) == 1
 		assert received(2) == expected(2) == 4
 		assert received(3) == expected(3) == 9
+
+		# Compare the outputs of the underlying callables
+		assert received.callable is callable_
+		assert received.callable(3) == expected.callable(3) == 9
+
+	@pytest.mark.parametrize(
+	    "callable1, callable2",
+	    [
+	        (lambda x: x + 1, lambda x: x + 2),
+	        (lambda x: x ** 2, lambda x: x ** 3),
+	        (lambda x: abs(x), lambda x: round(x)),
+	        (lambda x: x + 1, lambda x: x + 1.0),
+	        (lambda x: x + 1, lambda x: x + True),
+	        (lambda x: x + 0.0, lambda x: x + -0.0),
+	    ],
+	)
+	def test_NamedCallableProxy__different_callables__not_equal(self, callable1, callable2):
+		proxy1 = NamedCallableProxy(callable1)
+		proxy2 = NamedCallableProxy(callable2)
+
+		assert proxy1 != proxy2
+		assert hash(proxy1) != hash(proxy2)
+		assert len({proxy1, proxy2}) == 2